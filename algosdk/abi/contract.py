@@ -1,7 +1,14 @@
-import json
 from typing import Dict, List, Union, Optional, TypedDict
 
-from algosdk.abi.method import Method, MethodDict, get_method_by_name
+from algosdk import error
+from algosdk.abi import json_loader
+from algosdk.abi.immutable import Immutable
+from algosdk.abi.method import (
+    Method,
+    MethodDict,
+    MethodIndex,
+    shared_abi_types,
+)
 
 
 class NetworkInfoDict(TypedDict):
@@ -31,6 +38,8 @@ class Contract:
             particular network, such as an app-id.
     """
 
+    __slots__ = ("name", "methods", "_method_index", "desc", "networks")
+
     def __init__(
         self,
         name: str,
@@ -40,24 +49,41 @@ class Contract:
     ) -> None:
         self.name = name
         self.methods = methods
+        self._method_index = MethodIndex()
         self.desc = desc
         self.networks = networks if networks else {}
 
     def __eq__(self, o: object) -> bool:
+        if o is self:
+            return True
         if not isinstance(o, Contract):
             return False
         return (
             self.name == o.name
-            and self.methods == o.methods
             and self.desc == o.desc
             and self.networks == o.networks
+            and self.methods == o.methods
         )
 
     @staticmethod
     def from_json(resp: Union[str, bytes, bytearray]) -> "Contract":
-        d = json.loads(resp)
+        d = json_loader.json_loads(resp)
         return Contract.undictify(d)
 
+    @staticmethod
+    def from_json_many(resp: Union[str, bytes, bytearray]) -> List["Contract"]:
+        """
+        Parses a JSON array of contract descriptions in a single pass.
+        """
+        ds = json_loader.json_loads(resp)
+        if not isinstance(ds, list):
+            raise error.ABIEncodingError(
+                "expected a JSON array of contracts, got {}".format(
+                    type(ds).__name__
+                )
+            )
+        return Contract.undictify_many(ds)
+
     def dictify(self) -> ContractDict:
         d: ContractDict = {
             "name": self.name,
@@ -72,34 +98,54 @@ class Contract:
     def undictify(d: dict) -> "Contract":
         name = d["name"]
         method_list = [Method.undictify(method) for method in d["methods"]]
-        desc = d["desc"] if "desc" in d else None
-        networks = d["networks"] if "networks" in d else {}
-        for k, v in networks.items():
-            networks[k] = NetworkInfo.undictify(v)
+        desc = d.get("desc")
+        networks = {
+            k: NetworkInfo.undictify(v)
+            for k, v in d.get("networks", {}).items()
+        }
         return Contract(
             name=name, desc=desc, networks=networks, methods=method_list
         )
 
+    @staticmethod
+    def undictify_many(ds: List[dict]) -> List["Contract"]:
+        """
+        Builds a list of contracts, sharing one ABIType object per distinct
+        type string across all of them.
+        """
+        with shared_abi_types():
+            return [Contract.undictify(d) for d in ds]
+
     def get_method_by_name(self, name: str) -> Method:
-        return get_method_by_name(self.methods, name)
+        return self._method_index.get_method_by_name(self.methods, name)
 
 
-class NetworkInfo:
+class NetworkInfo(Immutable):
     """
-    Represents network information.
+    Represents network information. NetworkInfo objects are immutable and
+    hashable.
 
     Args:
         app_id (int): application ID on a particular network
     """
 
+    __slots__ = ("app_id",)
+
+    app_id: int
+
     def __init__(self, app_id: int) -> None:
-        self.app_id = app_id
+        object.__setattr__(self, "app_id", app_id)
 
     def __eq__(self, o: object) -> bool:
+        if o is self:
+            return True
         if not isinstance(o, NetworkInfo):
             return False
         return self.app_id == o.app_id
 
+    def __hash__(self) -> int:
+        return hash(self.app_id)
+
     def dictify(self) -> NetworkInfoDict:
         return {"appID": self.app_id}
 
@@ -0,0 +1,35 @@
+from typing import Any
+
+
+class Immutable:
+    """
+    Base for ABI value types that cannot be changed once constructed.
+
+    As with ``dataclass(frozen=True)``, subclasses set their fields (and any
+    lazily cached values) with ``object.__setattr__``, while ordinary
+    assignment and deletion always raise.
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            "cannot assign to {} of immutable {}".format(
+                name, type(self).__name__
+            )
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            "cannot delete {} of immutable {}".format(
+                name, type(self).__name__
+            )
+        )
+
+    def __setstate__(self, state: Any) -> None:
+        # copy and pickle restore slotted objects from a
+        # (dict_state, slot_state) pair by plain assignment, which is
+        # blocked here, so set the saved slots directly.
+        _, slot_state = state
+        for name, value in slot_state.items():
+            object.__setattr__(self, name, value)
@@ -1,7 +1,11 @@
-import json
 from typing import List, Union, Optional, TypedDict
 
-from algosdk.abi.method import Method, MethodDict, get_method_by_name
+from algosdk.abi import json_loader
+from algosdk.abi.method import (
+    Method,
+    MethodDict,
+    MethodIndex,
+)
 
 # In Python 3.11+ the following classes should be combined using `NotRequired`
 class InterfaceDict_Optional(TypedDict, total=False):
@@ -23,25 +27,30 @@ class Interface:
         desc (string, optional): description of the interface
     """
 
+    __slots__ = ("name", "methods", "_method_index", "desc")
+
     def __init__(
         self, name: str, methods: List[Method], desc: Optional[str] = None
     ) -> None:
         self.name = name
         self.methods = methods
+        self._method_index = MethodIndex()
         self.desc = desc
 
     def __eq__(self, o: object) -> bool:
+        if o is self:
+            return True
         if not isinstance(o, Interface):
             return False
         return (
             self.name == o.name
-            and self.methods == o.methods
             and self.desc == o.desc
+            and self.methods == o.methods
         )
 
     @staticmethod
     def from_json(resp: Union[str, bytes, bytearray]) -> "Interface":
-        d = json.loads(resp)
+        d = json_loader.json_loads(resp)
         return Interface.undictify(d)
 
     def dictify(self) -> InterfaceDict:
@@ -57,8 +66,8 @@ class Interface:
     def undictify(d: dict) -> "Interface":
         name = d["name"]
         method_list = [Method.undictify(method) for method in d["methods"]]
-        desc = d["desc"] if "desc" in d else None
+        desc = d.get("desc")
         return Interface(name=name, desc=desc, methods=method_list)
 
     def get_method_by_name(self, name: str) -> Method:
-        return get_method_by_name(self.methods, name)
+        return self._method_index.get_method_by_name(self.methods, name)
@@ -0,0 +1,21 @@
+"""
+JSON parsing for ABI descriptions.
+
+When the optional ``orjson`` package is installed (``pip install
+py-algorand-sdk[orjson]``), ABI JSON is parsed with ``orjson.loads``,
+which is considerably faster than the standard library. Otherwise
+``json.loads`` is used. Well-formed ABI descriptions parse the same way
+with either, but orjson is stricter about some inputs:
+
+* ``bytes`` input must be UTF-8; UTF-16 and UTF-32 encoded ``bytes`` raise
+  ``json.JSONDecodeError``.
+* ``NaN``, ``Infinity`` and ``-Infinity`` are rejected.
+* Lone surrogate escapes such as ``"\ud800"`` are rejected.
+* Integers outside [-2**63, 2**64-1] are parsed as floats, losing
+  precision.
+"""
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
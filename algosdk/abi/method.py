@@ -1,9 +1,60 @@
-import json
-from typing import List, Union, Optional, TypedDict
+import contextlib
+import re
+import sys
+import threading
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from Cryptodome.Hash import SHA512
 
-from algosdk import abi, constants, error
+from algosdk import constants, error
+from algosdk.abi import json_loader
+from algosdk.abi.base_type import ABIType
+from algosdk.abi.immutable import Immutable
+from algosdk.abi.reference import is_abi_reference_type
+from algosdk.abi.transaction import is_abi_transaction_type
+from algosdk.abi.tuple_type import TupleType
+
+PAREN_REGEX = re.compile(r"[()]")
+
+# Holds the ABIType cache of the active shared_abi_types() block, if any.
+_type_cache = threading.local()
+
+
+@contextlib.contextmanager
+def shared_abi_types() -> Iterator[None]:
+    """
+    Within this context, every Argument and Returns built from the same type
+    string shares a single ABIType object instead of parsing its own copy.
+    Nested contexts reuse the outermost cache.
+    """
+    if getattr(_type_cache, "types", None) is not None:
+        yield
+        return
+    _type_cache.types = {}
+    try:
+        yield
+    finally:
+        _type_cache.types = None
+
+
+def _abi_type_from_string(s: str) -> ABIType:
+    types = getattr(_type_cache, "types", None)
+    if types is None:
+        return ABIType.from_string(s)
+    t = types.get(s)
+    if t is None:
+        t = types[s] = ABIType.from_string(s)
+    return t
+
 
 # In Python 3.11+ the following classes should be combined using `NotRequired`
 class MethodDict_Optional(TypedDict, total=False):
@@ -16,52 +67,88 @@ class MethodDict(MethodDict_Optional):
     returns: dict
 
 
-class Method:
+class Method(Immutable):
     """
-    Represents a ABI method description.
+    Represents a ABI method description. Methods are hashable and their
+    fields cannot be reassigned. The signature, selector and transaction
+    count are derived from the Argument and Returns objects, so those (and
+    the ABIType values they hold) must not be modified afterwards.
 
     Args:
         name (string): name of the method
         args (list): list of Argument objects with type, name, and optional
-        description
+        description. They are stored as a tuple so the cached signature,
+        selector and transaction count always match them.
         returns (Returns): a Returns object with a type and optional description
         desc (string, optional): optional description of the method
     """
 
+    __slots__ = (
+        "name",
+        "args",
+        "desc",
+        "returns",
+        "txn_calls",
+        "_signature",
+        "_selector",
+    )
+
+    name: str
+    args: Tuple["Argument", ...]
+    desc: Optional[str]
+    returns: "Returns"
+    txn_calls: int
+    _signature: str
+    _selector: bytes
+
     def __init__(
         self,
         name: str,
-        args: List["Argument"],
+        args: Sequence["Argument"],
         returns: "Returns",
         desc: Optional[str] = None,
     ) -> None:
-        self.name = name
-        self.args = args
-        self.desc = desc
-        self.returns = returns
+        args = tuple(args)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "args", args)
+        object.__setattr__(self, "desc", desc)
+        object.__setattr__(self, "returns", returns)
         # Calculate number of method calls passed in as arguments and
-        # add one for this method call itself.
-        txn_count = 1
-        for arg in self.args:
-            if abi.is_abi_transaction_type(arg.type):
-                txn_count += 1
-        self.txn_calls = txn_count
+        # add one for this method call itself. Checking the cached type
+        # string keeps every membership test a plain string comparison.
+        txn_calls = 1 + sum(
+            1 for arg in args if is_abi_transaction_type(str(arg))
+        )
+        object.__setattr__(self, "txn_calls", txn_calls)
 
     def __eq__(self, o: object) -> bool:
+        if o is self:
+            return True
         if not isinstance(o, Method):
             return False
         return (
             self.name == o.name
-            and self.args == o.args
-            and self.returns == o.returns
-            and self.desc == o.desc
             and self.txn_calls == o.txn_calls
+            and self.desc == o.desc
+            and self.returns == o.returns
+            and self.args == o.args
         )
 
+    def __hash__(self) -> int:
+        return hash((self.name, self.desc, self.txn_calls))
+
     def get_signature(self) -> str:
-        arg_string = ",".join(str(arg.type) for arg in self.args)
-        ret_string = self.returns.type
-        return "{}({}){}".format(self.name, arg_string, ret_string)
+        # The signature and selector are computed lazily on first use and
+        # cached, since they are needed on every ABI method call.
+        try:
+            return self._signature
+        except AttributeError:
+            pass
+        arg_string = ",".join(str(arg) for arg in self.args)
+        ret_string = str(self.returns)
+        signature = "{}({}){}".format(self.name, arg_string, ret_string)
+        object.__setattr__(self, "_signature", signature)
+        return signature
 
     def get_selector(self) -> bytes:
         """
@@ -71,9 +158,15 @@ class Method:
         Returns:
             bytes: first four bytes of the method signature hash
         """
+        try:
+            return self._selector
+        except AttributeError:
+            pass
         hash = SHA512.new(truncate="256")
         hash.update(self.get_signature().encode("utf-8"))
-        return hash.digest()[:4]
+        selector = hash.digest()[:4]
+        object.__setattr__(self, "_selector", selector)
+        return selector
 
     def get_txn_calls(self) -> int:
         """
@@ -85,15 +178,21 @@ class Method:
     def _parse_string(s: str) -> list:
         # Parses a method signature into three tokens, returned as a list:
         # e.g. 'a(b,c)d' -> ['a', 'b,c', 'd']
-        stack = []
-        for i, char in enumerate(s):
-            if char == "(":
-                stack.append(i)
-            elif char == ")":
-                if not stack:
+        # Only parentheses affect the split, so jump between them with a
+        # compiled regex rather than stepping through every character.
+        depth = 0
+        left_index = 0
+        for match in PAREN_REGEX.finditer(s):
+            i = match.start()
+            if match.group() == "(":
+                if depth == 0:
+                    left_index = i
+                depth += 1
+            else:
+                if depth == 0:
                     break
-                left_index = stack.pop()
-                if not stack:
+                depth -= 1
+                if depth == 0:
                     return [s[:left_index], s[left_index + 1 : i], s[i + 1 :]]
 
         raise error.ABIEncodingError(
@@ -102,7 +201,7 @@ class Method:
 
     @staticmethod
     def from_json(resp: Union[str, bytes, bytearray]) -> "Method":
-        method_dict = json.loads(resp)
+        method_dict = json_loader.json_loads(resp)
         return Method.undictify(method_dict)
 
     @staticmethod
@@ -113,7 +212,7 @@ class Method:
         # and the last token should be the return type (or void).
         tokens = Method._parse_string(s)
         argument_list = [
-            Argument(t) for t in abi.TupleType._parse_tuple(tokens[1])
+            Argument(t) for t in TupleType._parse_tuple(tokens[1])
         ]
         return_type = Returns(tokens[-1])
         return Method(name=tokens[0], args=argument_list, returns=return_type)
@@ -133,13 +232,52 @@ class Method:
         name = d["name"]
         arg_list = [Argument.undictify(arg) for arg in d["args"]]
         return_obj = Returns.undictify(d["returns"])
-        desc = d["desc"] if "desc" in d else None
+        desc = d.get("desc")
         return Method(name=name, args=arg_list, returns=return_obj, desc=desc)
 
 
 def get_method_by_name(methods: List[Method], name: str) -> Method:
     methods_filtered = [method for method in methods if method.name == name]
+    return _get_unique_method(methods_filtered, name)
+
 
+def index_methods_by_name(methods: List[Method]) -> Dict[str, List[Method]]:
+    """
+    Groups methods by name, keeping every method that shares a name so that
+    overloaded methods can still be reported on lookup.
+    """
+    index: Dict[str, List[Method]] = {}
+    for method in methods:
+        index.setdefault(method.name, []).append(method)
+    return index
+
+
+def get_method_from_index(index: Dict[str, List[Method]], name: str) -> Method:
+    return _get_unique_method(index.get(name, []), name)
+
+
+class MethodIndex:
+    """
+    Name index over a methods list that may be reassigned or changed in
+    place. The index is rebuilt on lookup whenever the list no longer
+    matches the one it was built from.
+    """
+
+    __slots__ = ("_methods", "_by_name")
+
+    def __init__(self) -> None:
+        self._methods: List[Method] = []
+        self._by_name: Dict[str, List[Method]] = {}
+
+    def get_method_by_name(self, methods: List[Method], name: str) -> Method:
+        # Unchanged entries compare by identity, so the check stays cheap.
+        if methods != self._methods:
+            self._methods = list(methods)
+            self._by_name = index_methods_by_name(methods)
+        return get_method_from_index(self._by_name, name)
+
+
+def _get_unique_method(methods_filtered: List[Method], name: str) -> Method:
     if len(methods_filtered) > 1:
         raise KeyError(
             "found {} methods with the same name {}".format(
@@ -158,7 +296,12 @@ def get_method_by_name(methods: List[Method], name: str) -> Method:
 
 class Argument:
     """
-    Represents an argument for a ABI method
+    Represents an argument for a ABI method. Arguments are hashable;
+    don't change one while it is in a set or dict, or after it is passed to
+    a Method, whose signature and selector are derived from it. The ABIType
+    in `type` must not be mutated in place, since equality, hashing and
+    serialization use the type string cached when `type` is set, and with
+    shared_abi_types() one ABIType object can back many arguments.
 
     Args:
         arg_type (string): ABI type or transaction string of the method argument
@@ -166,35 +309,58 @@ class Argument:
         desc (string, optional): description of this method argument
     """
 
+    __slots__ = ("_type", "_type_str", "name", "desc")
+
     def __init__(
         self,
         arg_type: str,
         name: Optional[str] = None,
         desc: Optional[str] = None,
     ) -> None:
-        if abi.is_abi_transaction_type(arg_type) or abi.is_abi_reference_type(
+        t: Union[str, ABIType]
+        if is_abi_transaction_type(arg_type) or is_abi_reference_type(
             arg_type
         ):
-            self.type: Union[str, abi.ABIType] = arg_type
+            t = arg_type
         else:
             # If the type cannot be parsed into an ABI type, it will error
-            self.type = abi.ABIType.from_string(arg_type)
+            t = _abi_type_from_string(arg_type)
+        self._type = t
+        # Type strings are canonical, so an interned copy lets equality
+        # checks and serialization skip rebuilding str(self.type).
+        self._type_str = sys.intern(str(t))
         self.name = name
         self.desc = desc
 
+    @property
+    def type(self) -> Union[str, ABIType]:
+        return self._type
+
+    @type.setter
+    def type(self, t: Union[str, ABIType]) -> None:
+        self._type = t
+        self._type_str = sys.intern(str(t))
+
     def __eq__(self, o: object) -> bool:
+        if o is self:
+            return True
         if not isinstance(o, Argument):
             return False
         return (
-            self.name == o.name and self.type == o.type and self.desc == o.desc
+            self.name == o.name
+            and self._type_str == o._type_str
+            and self.desc == o.desc
         )
 
+    def __hash__(self) -> int:
+        return hash((self.name, self._type_str, self.desc))
+
     def __str__(self) -> str:
-        return str(self.type)
+        return self._type_str
 
     def dictify(self) -> dict:
         d = {}
-        d["type"] = str(self.type)
+        d["type"] = self._type_str
         if self.name:
             d["name"] = self.name
         if self.desc:
@@ -205,48 +371,67 @@ class Argument:
     def undictify(d: dict) -> "Argument":
         return Argument(
             arg_type=d["type"],
-            name=d["name"] if "name" in d else None,
-            desc=d["desc"] if "desc" in d else None,
+            name=d.get("name"),
+            desc=d.get("desc"),
         )
 
 
 class Returns:
     """
-    Represents a return type for a ABI method
+    Represents a return type for a ABI method. Returns objects are hashable
+    and, like Argument, must not be changed once passed to a Method or have
+    their ABIType mutated in place.
 
     Args:
         arg_type (string): ABI type of this return argument
         desc (string, optional): description of this return argument
     """
 
+    __slots__ = ("_type", "_type_str", "desc")
+
     # Represents a void return.
     VOID = "void"
 
     def __init__(self, arg_type: str, desc: Optional[str] = None) -> None:
+        t: Union[str, ABIType]
         if arg_type == "void":
-            self.type: Union[str, abi.ABIType] = self.VOID
+            t = self.VOID
         else:
             # If the type cannot be parsed into an ABI type, it will error.
-            self.type = abi.ABIType.from_string(arg_type)
+            t = _abi_type_from_string(arg_type)
+        self._type = t
+        self._type_str = sys.intern(str(t))
         self.desc = desc
 
+    @property
+    def type(self) -> Union[str, ABIType]:
+        return self._type
+
+    @type.setter
+    def type(self, t: Union[str, ABIType]) -> None:
+        self._type = t
+        self._type_str = sys.intern(str(t))
+
     def __eq__(self, o: object) -> bool:
+        if o is self:
+            return True
         if not isinstance(o, Returns):
             return False
-        return self.type == o.type and self.desc == o.desc
+        return self._type_str == o._type_str and self.desc == o.desc
+
+    def __hash__(self) -> int:
+        return hash((self._type_str, self.desc))
 
     def __str__(self) -> str:
-        return str(self.type)
+        return self._type_str
 
     def dictify(self) -> dict:
         d = {}
-        d["type"] = str(self.type)
+        d["type"] = self._type_str
         if self.desc:
             d["desc"] = self.desc
         return d
 
     @staticmethod
     def undictify(d: dict) -> "Returns":
-        return Returns(
-            arg_type=d["type"], desc=d["desc"] if "desc" in d else None
-        )
+        return Returns(arg_type=d["type"], desc=d.get("desc"))
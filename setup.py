@@ -22,6 +22,10 @@ setuptools.setup(
         "pycryptodomex>=3.6.0,<4",
         "msgpack>=1.0.0,<2",
     ],
+    extras_require={
+        # Faster ABI JSON parsing, see algosdk/abi/json_loader.py
+        "orjson": ["orjson>=3.0.0,<4"],
+    },
     packages=setuptools.find_packages(
         include=(
             "algosdk",
@@ -1,11 +1,18 @@
+import copy
+import importlib
+import json
+import pickle
 import random
 import string
+import sys
 import unittest
+from unittest import mock
 
 from algosdk import account, encoding, error
 from algosdk.abi import (
     ABIType,
     AddressType,
+    Argument,
     ArrayDynamicType,
     ArrayStaticType,
     BoolType,
@@ -14,11 +21,13 @@ from algosdk.abi import (
     Interface,
     Method,
     NetworkInfo,
+    Returns,
     StringType,
     TupleType,
     UfixedType,
     UintType,
 )
+from algosdk.abi import json_loader
 
 
 class TestABIType(unittest.TestCase):
@@ -694,6 +703,59 @@ class TestABIInteraction(unittest.TestCase):
             # Check txn calls
             self.assertEqual(m.get_txn_calls(), test_case[4])
 
+    def test_parse_method_string(self):
+        test_cases = [
+            ("f()", ["f", "", ""]),
+            ("f(a,b)c", ["f", "a,b", "c"]),
+            ("f((a,(b,c)),d[2])(e,f)", ["f", "(a,(b,c)),d[2]", "(e,f)"]),
+            ("f(a)(b)c", ["f", "a", "(b)c"]),
+        ]
+        for s, expected in test_cases:
+            self.assertEqual(Method._parse_string(s), expected)
+
+        for s in ["f)(", "f((", "f(a", "f", ""]:
+            with self.assertRaises(error.ABIEncodingError):
+                Method._parse_string(s)
+
+    def test_argument_and_returns_equality(self):
+        arg_cases = [
+            ("(uint64,bool)", "(uint64,bool)", True),
+            ("(uint64,bool)", "(uint64,byte)", False),
+            ("(uint64,(bool,string))", "(uint64,(bool,string))", True),
+            ("(uint64,(bool,string))", "(uint64,bool,string)", False),
+            ("uint64[2]", "uint64[2]", True),
+            ("uint64[2]", "uint64[3]", False),
+            ("uint64[2]", "uint64[]", False),
+            ("byte[]", "byte[]", True),
+            ("(byte[],address)[]", "(byte[],address)[]", True),
+            ("pay", "pay", True),
+            ("pay", "txn", False),
+            ("account", "account", True),
+            ("account", "address", False),
+            ("application", "uint64", False),
+            ("axfer", "byte", False),
+        ]
+        for first, second, equal in arg_cases:
+            a, b = Argument(first), Argument(second)
+            self.assertEqual(a == b, equal, (first, second))
+            # Equality must agree with comparing the types themselves
+            self.assertEqual(a.type == b.type, equal, (first, second))
+        self.assertNotEqual(Argument("uint64", name="a"), Argument("uint64"))
+
+        returns_cases = [
+            ("void", "void", True),
+            ("void", "uint64", False),
+            ("(uint8,string)", "(uint8,string)", True),
+            ("(uint8,string)", "(uint8,string[])", False),
+            ("bool[4]", "bool[4]", True),
+            ("bool[4]", "bool[5]", False),
+        ]
+        for first, second, equal in returns_cases:
+            r, o = Returns(first), Returns(second)
+            self.assertEqual(r == o, equal, (first, second))
+            self.assertEqual(r.type == o.type, equal, (first, second))
+        self.assertNotEqual(Returns("uint64", desc="sum"), Returns("uint64"))
+
     def test_interface(self):
         test_json = '{"name": "Calculator","desc":"This is an example interface","methods": [{ "name": "add", "returns": {"type": "void"}, "args": [ { "name": "a", "type": "uint64", "desc": "..." },{ "name": "b", "type": "uint64", "desc": "..." } ] },{ "name": "multiply", "returns": {"type": "void"}, "args": [ { "name": "a", "type": "uint64", "desc": "..." },{ "name": "b", "type": "uint64", "desc": "..." } ] }]}'
         i = Interface.from_json(test_json)
@@ -724,3 +786,147 @@ class TestABIInteraction(unittest.TestCase):
             [m.get_signature() for m in c.methods],
             ["add(uint64,uint64)void", "multiply(uint64,uint64)void"],
         )
+
+    def test_get_method_by_name(self):
+        methods = [
+            Method.from_signature("add(uint64,uint64)uint128"),
+            Method.from_signature("mul(uint64,uint64)uint128"),
+            Method.from_signature("mul(uint32,uint32)uint64"),
+        ]
+        for holder in (Interface("Calc", methods), Contract("Calc", methods)):
+            self.assertEqual(
+                holder.get_method_by_name("add").get_signature(),
+                "add(uint64,uint64)uint128",
+            )
+            with self.assertRaises(KeyError):
+                holder.get_method_by_name("mul")
+            with self.assertRaises(KeyError):
+                holder.get_method_by_name("sub")
+
+            # Reassigning methods must refresh the name lookup
+            holder.methods = methods[1:2]
+            self.assertEqual(
+                holder.get_method_by_name("mul").get_signature(),
+                "mul(uint64,uint64)uint128",
+            )
+            with self.assertRaises(KeyError):
+                holder.get_method_by_name("add")
+
+            # Changing the list in place must be picked up as well
+            holder.methods.append(methods[0])
+            self.assertEqual(
+                holder.get_method_by_name("add").get_signature(),
+                "add(uint64,uint64)uint128",
+            )
+            holder.methods[0] = methods[2]
+            self.assertEqual(
+                holder.get_method_by_name("mul").get_signature(),
+                "mul(uint32,uint32)uint64",
+            )
+
+    def test_contract_undictify_does_not_mutate_input(self):
+        d = {
+            "name": "Calculator",
+            "networks": {"mainnet": {"appID": 1234}},
+            "methods": [
+                {"name": "noop", "args": [], "returns": {"type": "void"}}
+            ],
+        }
+        c = Contract.undictify(d)
+        self.assertEqual(c.networks, {"mainnet": NetworkInfo(app_id=1234)})
+        self.assertEqual(d["networks"], {"mainnet": {"appID": 1234}})
+        self.assertEqual(c.dictify(), d)
+
+    def test_contract_undictify_many(self):
+        d = {
+            "name": "Calculator",
+            "methods": [
+                {
+                    "name": "add",
+                    "args": [{"type": "uint64"}, {"type": "uint64"}],
+                    "returns": {"type": "uint64"},
+                }
+            ],
+        }
+        contracts = Contract.undictify_many([d, d])
+        self.assertEqual(contracts, [Contract.undictify(d)] * 2)
+
+        # Equal type strings share a single ABIType object
+        first, second = (c.methods[0] for c in contracts)
+        self.assertIs(first.args[0].type, first.args[1].type)
+        self.assertIs(first.args[0].type, second.returns.type)
+
+        self.assertEqual(
+            Contract.from_json_many(json.dumps([d, d])), contracts
+        )
+        with self.assertRaises(error.ABIEncodingError):
+            Contract.from_json_many(json.dumps(d))
+
+    def test_method_values_are_immutable_and_hashable(self):
+        m = Method.from_signature("add(uint64,uint64)uint128")
+        same = Method.from_signature("add(uint64,uint64)uint128")
+        self.assertEqual(len({m, same}), 1)
+        self.assertEqual(len({m.args[0], same.args[1]}), 1)
+        self.assertEqual(len({m.returns, same.returns}), 1)
+        self.assertEqual(len({NetworkInfo(1), NetworkInfo(1)}), 1)
+
+        self.assertEqual(m.get_selector(), b"\x8a\xa3\xb6\x1f")
+        with self.assertRaises(AttributeError):
+            m.name = "sub"
+        with self.assertRaises(AttributeError):
+            del m.desc
+        with self.assertRaises(AttributeError):
+            NetworkInfo(1).app_id = 2
+        self.assertEqual(m.get_signature(), "add(uint64,uint64)uint128")
+
+        # Reassigning an argument's type keeps its cached type string in sync
+        a = Argument("uint64")
+        a.type = ABIType.from_string("(uint64,bool)")
+        self.assertEqual(str(a), "(uint64,bool)")
+        self.assertEqual(a.dictify(), {"type": "(uint64,bool)"})
+        self.assertEqual(a, Argument("(uint64,bool)"))
+        r = Returns("void")
+        r.type = ABIType.from_string("string")
+        self.assertEqual(r, Returns("string"))
+
+        # Copies restore the frozen fields along with any cached values
+        for clone in (
+            copy.copy(m),
+            copy.deepcopy(m),
+            pickle.loads(pickle.dumps(m)),
+        ):
+            self.assertEqual(clone, m)
+            self.assertEqual(clone.get_selector(), m.get_selector())
+
+    def test_method_args_cannot_change_after_construction(self):
+        args = [Argument("uint64")]
+        m = Method("f", args, Returns("void"))
+        self.assertEqual(m.get_signature(), "f(uint64)void")
+
+        # Neither the caller's list nor the stored args can change the
+        # cached signature, selector or transaction count
+        args.append(Argument("pay"))
+        with self.assertRaises(AttributeError):
+            m.args.append(Argument("pay"))
+        self.assertEqual(m.args, (Argument("uint64"),))
+        self.assertEqual(m.get_signature(), "f(uint64)void")
+        self.assertEqual(m.get_txn_calls(), 1)
+
+    def test_from_json_without_orjson(self):
+        # Force the stdlib fallback, then restore whichever parser is
+        # installed once the test is done
+        with mock.patch.dict(sys.modules, {"orjson": None}):
+            importlib.reload(json_loader)
+        self.addCleanup(importlib.reload, json_loader)
+        self.assertIs(json_loader.json_loads, json.loads)
+
+        method_json = '{"name": "add", "args": [{"type": "uint64"}], "returns": {"type": "void"}}'
+        m = Method.from_json(method_json)
+        self.assertEqual(m.get_signature(), "add(uint64)void")
+
+        # Only the stdlib parser accepts UTF-16 encoded bytes
+        contract_json = '{"name": "Calc", "methods": [' + method_json + "]}"
+        c = Contract.from_json(contract_json.encode("utf-16"))
+        self.assertEqual(c.methods, [m])
+        i = Interface.from_json(contract_json.encode("utf-16"))
+        self.assertEqual(i.methods, [m])